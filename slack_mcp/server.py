@@ -3,12 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Literal
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Progress
 
-from .slack_client import SlackClient, SlackConfig
+from .slack_client import SlackClient
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Slack client's HTTP session on shutdown."""
+    from .tools.messaging import _get_client as _get_shared_client
+
+    try:
+        yield
+    finally:
+        if _get_shared_client.cache_info().currsize:
+            await _get_shared_client().aclose()
+
 
 # Create the MCP server with task support
 mcp = FastMCP(
@@ -24,6 +39,8 @@ Environment variables required:
 - SLACK_BOT_TOKEN: Your Slack bot token (xoxb-...)
 - SLACK_DEFAULT_CHANNEL: Optional default channel for messages
 - SLACK_USER_ID: Optional user ID for @mentions (get from Slack profile)
+- SLACK_APP_TOKEN: Optional app-level token (xapp-...) to receive replies
+  instantly over Socket Mode instead of polling
 
 The user can reply to your messages in Slack threads, and you can
 retrieve their responses using the ask_user tool or get_thread_replies.
@@ -31,13 +48,15 @@ retrieve their responses using the ask_user tool or get_thread_replies.
 IMPORTANT: The ask_user tool BLOCKS while waiting for a reply. To run it
 non-blocking, wrap the call in a background task/agent. This allows you to
 continue working while waiting for the user's Slack reply.""",
+    lifespan=_lifespan,
 )
 
 
 def _get_client() -> SlackClient:
-    """Get or create a Slack client."""
-    config = SlackConfig.from_env()
-    return SlackClient(config)
+    """Get the Slack client shared with the messaging tools."""
+    from .tools.messaging import _get_client as _get_shared_client
+
+    return _get_shared_client()
 
 
 @mcp.tool(task=True)
@@ -74,6 +93,8 @@ async def ask_user(
     Returns:
         Dict with success status and user's reply text if received.
     """
+    from .tools.messaging import _format_question
+
     client = _get_client()
 
     # Cap timeout at 30 minutes
@@ -81,25 +102,13 @@ async def ask_user(
     timeout_seconds = timeout_minutes * 60
 
     # Format the question message
-    if context:
-        formatted_message = (
-            f":question: *Claude Code needs your input*\n\n"
-            f"*Context:* {context}\n\n"
-            f"*Question:* {question}\n\n"
-            f"_Reply in this thread within {timeout_minutes} minutes._"
-        )
-    else:
-        formatted_message = (
-            f":question: *Claude Code needs your input*\n\n"
-            f"{question}\n\n"
-            f"_Reply in this thread within {timeout_minutes} minutes._"
-        )
+    formatted_message = _format_question(question, context, timeout_minutes)
 
     # Report progress: sending question
     await progress.set_message("Sending question to Slack...")
 
     # Send the question
-    send_result = client.send_message(text=formatted_message, channel=channel)
+    send_result = await client.send_message(text=formatted_message, channel=channel)
 
     if not send_result.ok:
         return {
@@ -113,45 +122,49 @@ async def ask_user(
     await progress.set_message(f"Waiting for reply (up to {timeout_minutes} min)...")
     await progress.set_total(timeout_seconds)
 
-    # Poll for reply with progress updates
-    poll_interval = 5  # seconds
-    elapsed = 0
+    # Report elapsed time while waiting; the wait itself is event-driven
+    # with Socket Mode, so progress is updated independently of it
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    async def _report_progress() -> None:
+        while True:
+            await progress.set_current(int(loop.time() - start_time))
+            await asyncio.sleep(5)
 
-    while elapsed < timeout_seconds:
-        # Check for replies
-        replies = client.get_thread_replies(
+    reporter = asyncio.create_task(_report_progress())
+    try:
+        reply = await client.wait_for_reply(
             channel=send_result.channel,
             thread_ts=send_result.ts,
-            since_ts=None,
+            timeout_seconds=timeout_seconds,
         )
-
-        if replies:
-            reply = replies[0]  # Get the first reply
-            # Send acknowledgment
-            client.send_message(
+    finally:
+        reporter.cancel()
+
+    if reply:
+        # Acknowledge with a reaction; fall back to a reply if the app
+        # lacks the reactions:write scope
+        if not await client.react(send_result.channel, reply.ts, "white_check_mark"):
+            await client.send_message(
                 text=":white_check_mark: Got it, thanks!",
                 channel=send_result.channel,
                 thread_ts=send_result.ts,
             )
 
-            return {
-                "success": True,
-                "message": "Received user reply",
-                "reply": reply.text,
-                "replied_by": reply.user_name or reply.user,
-                "user_id": reply.user,
-                "ts": reply.ts,
-                "channel": send_result.channel,
-                "thread_ts": send_result.ts,
-            }
-
-        # Update progress
-        await progress.set_current(elapsed)
-        await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
+        return {
+            "success": True,
+            "message": "Received user reply",
+            "reply": reply.text,
+            "replied_by": await client.resolve_user_name(reply) or reply.user,
+            "user_id": reply.user,
+            "ts": reply.ts,
+            "channel": send_result.channel,
+            "thread_ts": send_result.ts,
+        }
 
     # Timeout reached
-    client.send_message(
+    await client.send_message(
         text=f":hourglass: No reply received after {timeout_minutes} minutes. Continuing without input.",
         channel=send_result.channel,
         thread_ts=send_result.ts,
@@ -167,7 +180,7 @@ async def ask_user(
 
 
 @mcp.tool()
-def send(
+async def send(
     message: str,
     channel: str | None = None,
     thread_ts: str | None = None,
@@ -188,7 +201,7 @@ def send(
     """
     from .tools.messaging import send as _send
 
-    return _send(
+    return await _send(
         message=message,
         channel=channel,
         thread_ts=thread_ts,
@@ -198,7 +211,7 @@ def send(
 
 
 @mcp.tool()
-def get_thread_replies(
+async def get_thread_replies(
     channel: str,
     thread_ts: str,
     since_ts: str | None = None,
@@ -217,7 +230,7 @@ def get_thread_replies(
     """
     from .tools.messaging import get_thread_replies as _get_thread_replies
 
-    return _get_thread_replies(channel=channel, thread_ts=thread_ts, since_ts=since_ts)
+    return await _get_thread_replies(channel=channel, thread_ts=thread_ts, since_ts=since_ts)
 
 
 def main():
@@ -2,22 +2,142 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import math
 import os
+import random
 import time
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+
+# slack_sdk and aiohttp are imported where they're used so that loading the
+# server doesn't pay for them until a Slack tool actually runs
+if TYPE_CHECKING:
+    import aiohttp
+    from slack_sdk.socket_mode.aiohttp import SocketModeClient
+    from slack_sdk.socket_mode.request import SocketModeRequest
+    from slack_sdk.web.async_client import AsyncWebClient
+
+_T = TypeVar("_T")
+
+# Slack's published rate limits as (requests, per seconds). Methods not listed
+# fall back to Tier 3.
+_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "auth_test": (100, 60),  # Tier 4
+    "chat_postMessage": (1, 1),  # Special: about one message per second
+    "conversations_history": (50, 60),  # Tier 3
+    "conversations_list": (20, 60),  # Tier 2
+    "conversations_replies": (50, 60),  # Tier 3
+    "reactions_add": (50, 60),  # Tier 3
+    "users_info": (100, 60),  # Tier 4
+}
+_DEFAULT_RATE_LIMIT = (50, 60)
+
+# User display names rarely change; failed lookups are cached too so an
+# unknown user isn't looked up again on every poll.
+_USER_CACHE_SIZE = 1024
+_USER_CACHE_TTL = 600  # seconds
+
+# Default bounds for the reply poll backoff when Socket Mode is unavailable
+_POLL_INITIAL_SEC = 2.0
+_POLL_MAX_SEC = 30.0
+
+# Layout of a Slack timestamp, e.g. "1700000000.000100"
+_TS_LEN = 17
+_TS_DOT = 10
+
+# Page size for thread fetches while waiting for an answer
+_REPLY_POLL_LIMIT = 10
+
+# Channel name -> ID mappings are persisted between runs, since resolving a
+# name means scanning every channel in the workspace
+_CHANNEL_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Message event subtypes that are new user posts; others (message_changed,
+# message_deleted, message_replied, bot_message, ...) are not replies
+_REPLY_SUBTYPES = frozenset({None, "thread_broadcast", "file_share", "me_message"})
+
+_MISSING = object()
+
+
+def _channel_cache_path(bot_token: str) -> Path:
+    """Get the on-disk channel cache file for a workspace's bot token."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    token_hash = hashlib.sha256(bot_token.encode()).hexdigest()[:16]
+    return Path(cache_home) / "slack_mcp" / f"channels-{token_hash}.json"
+
+
+def _seconds_from_env(name: str, default: float) -> float:
+    """Read a positive number of seconds from an environment variable."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = math.nan
+    if not (math.isfinite(seconds) and seconds > 0):
+        raise ValueError(f"{name} must be a positive number of seconds, got {value!r}.")
+    return seconds
+
+
+def _ts_after(ts: str, other: str) -> bool:
+    """Check whether Slack timestamp ts is later than other.
+
+    Slack timestamps are fixed-width "seconds.micros" strings, which order
+    correctly as strings; anything else is compared numerically.
+    """
+    if len(ts) == len(other) == _TS_LEN and ts[_TS_DOT] == other[_TS_DOT] == ".":
+        return ts > other
+    return float(ts) > float(other)
+
+
+def _json_session_options() -> dict[str, Any]:
+    """aiohttp session options that use orjson for JSON, if it's installed."""
+    try:
+        import orjson
+    except ImportError:
+        return {}
+
+    import aiohttp
+
+    class _OrjsonResponse(aiohttp.ClientResponse):
+        async def json(self, *, loads=orjson.loads, **kwargs):
+            return await super().json(loads=loads, **kwargs)
+
+    return {
+        "json_serialize": lambda obj: orjson.dumps(obj).decode(),
+        "response_class": _OrjsonResponse,
+    }
+
+
+def _retry_after(error: BaseException | None) -> float | None:
+    """Get the Retry-After delay in seconds if error is a Slack rate limit."""
+    from slack_sdk.errors import SlackApiError
 
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+    if not isinstance(error, SlackApiError) or error.response.get("error") != "ratelimited":
+        return None
+    return float(error.response.headers.get("Retry-After", 1))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SlackConfig:
     """Configuration for Slack client."""
 
     bot_token: str
     default_channel: str | None = None
     user_id: str | None = None
+    app_token: str | None = None
+    poll_initial_sec: float = _POLL_INITIAL_SEC
+    poll_max_sec: float = _POLL_MAX_SEC
 
     @classmethod
     def from_env(cls) -> "SlackConfig":
@@ -31,11 +151,26 @@ class SlackConfig:
 
         default_channel = os.environ.get("SLACK_DEFAULT_CHANNEL")
         user_id = os.environ.get("SLACK_USER_ID")
+        app_token = os.environ.get("SLACK_APP_TOKEN")
+        poll_initial_sec = _seconds_from_env("SLACK_POLL_INITIAL_SEC", _POLL_INITIAL_SEC)
+        poll_max_sec = _seconds_from_env("SLACK_POLL_MAX_SEC", _POLL_MAX_SEC)
+        if poll_max_sec < poll_initial_sec:
+            raise ValueError(
+                f"SLACK_POLL_MAX_SEC ({poll_max_sec:g}) must be at least "
+                f"SLACK_POLL_INITIAL_SEC ({poll_initial_sec:g})."
+            )
 
-        return cls(bot_token=bot_token, default_channel=default_channel, user_id=user_id)
+        return cls(
+            bot_token=bot_token,
+            default_channel=default_channel,
+            user_id=user_id,
+            app_token=app_token,
+            poll_initial_sec=poll_initial_sec,
+            poll_max_sec=poll_max_sec,
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     """A Slack message."""
 
@@ -47,7 +182,7 @@ class Message:
     channel: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of sending a message."""
 
@@ -57,32 +192,254 @@ class SendResult:
     error: str | None = None
 
 
+class SlackEventListener:
+    """Receives thread replies pushed by Slack over Socket Mode.
+
+    Requires an app-level token (xapp-...) and a Slack app with Socket Mode
+    enabled and subscribed to message events.
+    """
+
+    def __init__(self, app_token: str, web_client: AsyncWebClient):
+        self.app_token = app_token
+        self.web_client = web_client
+        self._socket: SocketModeClient | None = None
+        self._connect_lock = asyncio.Lock()
+        self._queues: dict[tuple[str, str], asyncio.Queue[Message]] = {}
+
+    async def start(self) -> None:
+        """Connect to Slack if not already connected."""
+        from slack_sdk.socket_mode.aiohttp import SocketModeClient
+
+        async with self._connect_lock:
+            if self._socket is not None:
+                return
+
+            socket = SocketModeClient(app_token=self.app_token, web_client=self.web_client)
+            socket.socket_mode_request_listeners.append(self._on_request)
+            await socket.connect()
+            self._socket = socket
+
+    async def close(self) -> None:
+        """Disconnect from Slack."""
+        if self._socket is not None:
+            await self._socket.close()
+            self._socket = None
+
+    def subscribe(self, channel: str, thread_ts: str) -> asyncio.Queue[Message]:
+        """Get a queue that receives new replies in a thread."""
+        return self._queues.setdefault((channel, thread_ts), asyncio.Queue())
+
+    def unsubscribe(self, channel: str, thread_ts: str) -> None:
+        """Stop delivering replies for a thread."""
+        self._queues.pop((channel, thread_ts), None)
+
+    async def _on_request(self, socket: SocketModeClient, req: SocketModeRequest) -> None:
+        """Acknowledge an incoming envelope and route thread replies."""
+        from slack_sdk.socket_mode.response import SocketModeResponse
+
+        await socket.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+
+        if req.type != "events_api":
+            return
+
+        event = req.payload.get("event", {})
+        if event.get("type") != "message" or event.get("bot_id"):
+            return
+        if event.get("subtype") not in _REPLY_SUBTYPES:
+            return
+
+        # Only replies, not the parent message itself
+        thread_ts = event.get("thread_ts")
+        if not thread_ts or event.get("ts") == thread_ts:
+            return
+
+        queue = self._queues.get((event.get("channel", ""), thread_ts))
+        if queue is not None:
+            queue.put_nowait(
+                Message(
+                    text=event.get("text", ""),
+                    user=event.get("user", ""),
+                    user_name=None,
+                    ts=event["ts"],
+                    thread_ts=thread_ts,
+                    channel=event["channel"],
+                )
+            )
+
+
 class SlackClient:
-    """Wrapper around Slack WebClient for MCP operations."""
+    """Wrapper around Slack AsyncWebClient for MCP operations."""
 
     def __init__(self, config: SlackConfig):
         self.config = config
-        self.client = WebClient(token=config.bot_token)
-        self._user_cache: dict[str, str] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._client: AsyncWebClient | None = None
+        self._user_cache: TTLCache[str, str | None] = TTLCache(
+            maxsize=_USER_CACHE_SIZE, ttl=_USER_CACHE_TTL
+        )
+        self._user_locks: dict[str, asyncio.Lock] = {}
+        self._events: SlackEventListener | None = None
+        self._channel_ids: dict[str, str] = {}
+        self._limiters: dict[str, AsyncLimiter] = {}
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._channel_cache_path = _channel_cache_path(config.bot_token)
+
+    @property
+    def client(self) -> AsyncWebClient:
+        """Slack API client backed by a shared keep-alive HTTP session.
+
+        Created on first use so the aiohttp session binds to the running loop.
+        """
+        if self._client is None:
+            import aiohttp
+            from slack_sdk.web.async_client import AsyncWebClient
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+                **_json_session_options(),
+            )
+            self._client = AsyncWebClient(
+                token=self.config.bot_token,
+                timeout=30,
+                session=self._session,
+            )
+        return self._client
+
+    @property
+    def events(self) -> SlackEventListener | None:
+        """Socket Mode listener, or None if SLACK_APP_TOKEN is not configured."""
+        if self._events is None and self.config.app_token:
+            self._events = SlackEventListener(self.config.app_token, self.client)
+        return self._events
+
+    async def aclose(self) -> None:
+        """Close the Socket Mode connection and the underlying HTTP session."""
+        if self._events is not None:
+            await self._events.close()
+            self._events = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._client = None
+
+    async def _single_flight(self, key: tuple, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Run fetch, sharing its result with concurrent calls for the same key.
+
+        Concurrent pollers of the same thread then cost a single API call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Future) -> None:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                # Retrieve the error so a fetch whose callers were all
+                # cancelled doesn't log "exception was never retrieved"
+                if not t.cancelled():
+                    t.exception()
 
-    def _get_user_name(self, user_id: str) -> str | None:
-        """Get user's display name from user ID."""
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+            task.add_done_callback(_done)
 
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        """Call a Slack API method, throttled to its rate limit.
+
+        A rate-limited call is retried once after Slack's Retry-After delay.
+        """
+        from slack_sdk.errors import SlackApiError
+
+        limiter = self._limiters.get(method)
+        if limiter is None:
+            limiter = AsyncLimiter(*_RATE_LIMITS.get(method, _DEFAULT_RATE_LIMIT))
+            self._limiters[method] = limiter
+
+        api_method = getattr(self.client, method)
+        async with limiter:
+            try:
+                return await api_method(**kwargs)
+            except SlackApiError as e:
+                retry_after = _retry_after(e)
+                if retry_after is None:
+                    raise
+
+        await asyncio.sleep(retry_after)
+        async with limiter:
+            return await api_method(**kwargs)
+
+    async def _get_user_name(self, user_id: str) -> str | None:
+        """Get user's display name from user ID.
+
+        Concurrent lookups for the same user share a single API call.
+        """
+        from slack_sdk.errors import SlackApiError
+
+        if not user_id:
+            return None
+
+        cached = self._user_cache.get(user_id, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        lock = self._user_locks.setdefault(user_id, asyncio.Lock())
         try:
-            result = self.client.users_info(user=user_id)
-            if result["ok"]:
-                user = result["user"]
-                name = user.get("real_name") or user.get("name") or user_id
+            async with lock:
+                cached = self._user_cache.get(user_id, _MISSING)
+                if cached is not _MISSING:
+                    return cached
+
+                name = None
+                try:
+                    result = await self._call("users_info", user=user_id)
+                    if result["ok"]:
+                        user = result["user"]
+                        name = user.get("real_name") or user.get("name") or user_id
+                except SlackApiError as e:
+                    # Don't cache transient failures such as rate limits
+                    if _retry_after(e) is not None:
+                        return None
+
                 self._user_cache[user_id] = name
                 return name
-        except SlackApiError:
-            pass
+        finally:
+            if self._user_locks.get(user_id) is lock:
+                del self._user_locks[user_id]
 
-        return None
+    async def resolve_user_name(self, message: Message) -> str | None:
+        """Get the display name of a message's author.
 
-    def send_message(
+        Args:
+            message: Message returned by get_thread_replies.
+
+        Returns:
+            The author's display name, or None if it can't be resolved.
+        """
+        return message.user_name or await self._get_user_name(message.user)
+
+    async def resolve_user_names(self, user_ids: Iterable[str]) -> dict[str, str | None]:
+        """Get display names for several users at once.
+
+        Each distinct user is looked up once; uncached lookups run concurrently.
+
+        Args:
+            user_ids: User IDs to resolve. Duplicates are allowed.
+
+        Returns:
+            Mapping of user ID to display name, or None if it can't be resolved.
+        """
+        unique_ids = list(dict.fromkeys(u for u in user_ids if u))
+        names = await asyncio.gather(
+            *(self._get_user_name(u) for u in unique_ids), return_exceptions=True
+        )
+        return {
+            user_id: None if isinstance(name, BaseException) else name
+            for user_id, name in zip(unique_ids, names)
+        }
+
+    async def send_message(
         self,
         text: str,
         channel: str | None = None,
@@ -98,6 +455,8 @@ class SlackClient:
         Returns:
             SendResult with message timestamp if successful.
         """
+        from slack_sdk.errors import SlackApiError
+
         target_channel = channel or self.config.default_channel
         if not target_channel:
             return SendResult(
@@ -107,7 +466,8 @@ class SlackClient:
             )
 
         try:
-            result = self.client.chat_postMessage(
+            result = await self._call(
+                "chat_postMessage",
                 channel=target_channel,
                 text=text,
                 thread_ts=thread_ts,
@@ -122,11 +482,32 @@ class SlackClient:
         except SlackApiError as e:
             return SendResult(ok=False, error=str(e.response["error"]))
 
-    def get_thread_replies(
+    async def react(self, channel: str, ts: str, name: str) -> bool:
+        """Add an emoji reaction to a message.
+
+        Args:
+            channel: Channel ID containing the message.
+            ts: Timestamp of the message.
+            name: Emoji name without colons, e.g. "white_check_mark".
+
+        Returns:
+            True if the message has the reaction.
+        """
+        from slack_sdk.errors import SlackApiError
+
+        try:
+            await self._call("reactions_add", channel=channel, timestamp=ts, name=name)
+        except SlackApiError as e:
+            return e.response.get("error") == "already_reacted"
+        return True
+
+    async def get_thread_replies(
         self,
         channel: str,
         thread_ts: str,
         since_ts: str | None = None,
+        limit: int | None = None,
+        first_only: bool = False,
     ) -> list[Message]:
         """Get replies in a thread.
 
@@ -134,75 +515,259 @@ class SlackClient:
             channel: Channel ID containing the thread.
             thread_ts: Timestamp of the parent message.
             since_ts: Only return messages after this timestamp.
+            limit: Messages to fetch per page (Slack default if None).
+            first_only: Stop paging at the first matching reply.
 
         Returns:
-            List of messages in the thread.
+            List of messages in the thread. Author names are not resolved;
+            use resolve_user_name for the messages that need them.
         """
+        key = ("replies", channel, thread_ts, since_ts, limit, first_only)
+        replies = await self._single_flight(
+            key,
+            lambda: self._fetch_thread_replies(channel, thread_ts, since_ts, limit, first_only),
+        )
+        return list(replies)
+
+    async def _fetch_thread_replies(
+        self,
+        channel: str,
+        thread_ts: str,
+        since_ts: str | None,
+        limit: int | None,
+        first_only: bool,
+    ) -> list[Message]:
+        """Fetch replies in a thread from Slack; see get_thread_replies."""
+        from slack_sdk.errors import SlackApiError
+
+        since = since_ts.strip() if since_ts else None
+
+        messages = []
+        cursor = None
         try:
-            result = self.client.conversations_replies(
-                channel=channel,
-                ts=thread_ts,
-                oldest=since_ts,
-            )
+            while True:
+                # Only fetch messages newer than since_ts; Slack still includes
+                # the parent message, which is filtered out below
+                result = await self._call(
+                    "conversations_replies",
+                    channel=channel,
+                    ts=thread_ts,
+                    oldest=since or thread_ts,
+                    inclusive=False,
+                    limit=limit,
+                    cursor=cursor,
+                )
 
-            messages = []
-            for msg in result.get("messages", []):
-                # Skip the parent message and bot messages
-                if msg.get("ts") == thread_ts:
-                    continue
-                if msg.get("bot_id"):
-                    continue
-                if since_ts and float(msg["ts"]) <= float(since_ts):
-                    continue
-
-                messages.append(
-                    Message(
-                        text=msg.get("text", ""),
-                        user=msg.get("user", ""),
-                        user_name=self._get_user_name(msg.get("user", "")),
-                        ts=msg["ts"],
-                        thread_ts=msg.get("thread_ts"),
-                        channel=channel,
+                for msg in result.get("messages", []):
+                    # Skip the parent message and bot messages
+                    if msg.get("ts") == thread_ts:
+                        continue
+                    if msg.get("bot_id"):
+                        continue
+                    if since and not _ts_after(msg["ts"], since):
+                        continue
+
+                    messages.append(
+                        Message(
+                            text=msg.get("text", ""),
+                            user=msg.get("user", ""),
+                            user_name=None,
+                            ts=msg["ts"],
+                            thread_ts=msg.get("thread_ts"),
+                            channel=channel,
+                        )
                     )
-                )
+                    if first_only:
+                        return messages
 
-            return messages
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    return messages
 
         except SlackApiError as e:
             raise RuntimeError(f"Failed to get thread replies: {e.response['error']}") from e
 
-    def wait_for_reply(
+    async def get_reply_count(self, channel: str, thread_ts: str) -> int | None:
+        """Get the number of replies in a thread.
+
+        Args:
+            channel: Channel ID containing the thread.
+            thread_ts: Timestamp of the parent message.
+
+        Returns:
+            Reply count of the parent message, or None if it wasn't found.
+        """
+        return await self._single_flight(
+            ("reply_count", channel, thread_ts),
+            lambda: self._fetch_reply_count(channel, thread_ts),
+        )
+
+    async def _fetch_reply_count(self, channel: str, thread_ts: str) -> int | None:
+        """Fetch a thread's reply count from Slack; see get_reply_count."""
+        from slack_sdk.errors import SlackApiError
+
+        try:
+            result = await self._call(
+                "conversations_history",
+                channel=channel,
+                latest=thread_ts,
+                oldest=thread_ts,
+                inclusive=True,
+                limit=1,
+            )
+        except SlackApiError as e:
+            raise RuntimeError(f"Failed to get reply count: {e.response['error']}") from e
+
+        for msg in result.get("messages", []):
+            if msg.get("ts") == thread_ts:
+                return msg.get("reply_count", 0)
+        return None
+
+    async def wait_for_reply(
         self,
         channel: str,
         thread_ts: str,
-        timeout_seconds: int = 300,
-        poll_interval: int = 5,
+        timeout_seconds: float = 300,
+        poll_interval: float | None = None,
     ) -> Message | None:
         """Wait for a reply in a thread.
 
+        Replies are pushed over Socket Mode when SLACK_APP_TOKEN is set;
+        otherwise, or if the connection fails, the thread is polled with
+        exponential backoff up to SLACK_POLL_MAX_SEC between polls.
+
         Args:
             channel: Channel ID containing the thread.
             thread_ts: Timestamp of the parent message.
             timeout_seconds: Maximum time to wait (default 5 minutes).
-            poll_interval: Seconds between poll attempts (default 5).
+            poll_interval: Seconds before the first re-poll
+                (default SLACK_POLL_INITIAL_SEC, 2).
 
         Returns:
             First new message in the thread, or None if timeout.
         """
-        start_time = time.time()
-        last_ts = thread_ts
+        import aiohttp
+        from slack_sdk.errors import SlackApiError
+
+        events = self.events
+        if events is not None:
+            try:
+                await events.start()
+            except (SlackApiError, aiohttp.ClientError):
+                pass
+            else:
+                return await self._wait_for_reply_event(events, channel, thread_ts, timeout_seconds)
+
+        if poll_interval is None:
+            poll_interval = self.config.poll_initial_sec
+
+        try:
+            return await asyncio.wait_for(
+                self._poll_until_reply(channel, thread_ts, poll_interval),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            return None
 
-        while time.time() - start_time < timeout_seconds:
-            replies = self.get_thread_replies(channel, thread_ts, since_ts=last_ts)
+    async def _poll_once(
+        self, channel: str, thread_ts: str, last_reply_count: int = 0
+    ) -> tuple[Message | None, int]:
+        """Check a thread once for its first reply.
 
-            if replies:
-                return replies[0]
+        The thread is only fetched once its reply count has grown past
+        last_reply_count, since checking the count is cheaper and idle
+        threads are the common case.
 
-            time.sleep(poll_interval)
+        Returns:
+            The first reply, if any, and the reply count to pass next time.
+        """
+        reply_count = await self.get_reply_count(channel, thread_ts)
+        if reply_count is not None and reply_count <= last_reply_count:
+            return None, last_reply_count
+
+        replies = await self.get_thread_replies(
+            channel, thread_ts, since_ts=thread_ts, limit=_REPLY_POLL_LIMIT, first_only=True
+        )
+        if reply_count is None:
+            reply_count = last_reply_count
+        return (replies[0] if replies else None), reply_count
+
+    async def _poll_until_reply(
+        self, channel: str, thread_ts: str, poll_interval: float
+    ) -> Message:
+        """Poll a thread with exponential backoff until it gets a reply."""
+        attempts = 0
+        reply_count = 0
+        while True:
+            try:
+                reply, reply_count = await self._poll_once(channel, thread_ts, reply_count)
+            except RuntimeError as e:
+                retry_after = _retry_after(e.__cause__)
+                if retry_after is None:
+                    raise
+                await asyncio.sleep(retry_after)
+                continue
+            except asyncio.TimeoutError:
+                # An HTTP timeout (aiohttp.ServerTimeoutError subclasses
+                # asyncio.TimeoutError) must not look like the wait's own
+                # deadline to the caller, so treat it as an idle poll
+                reply = None
+
+            if reply:
+                return reply
+
+            # Back off while the thread stays idle; jitter keeps concurrent
+            # waiters from polling in lockstep
+            interval = min(self.config.poll_max_sec, poll_interval * 1.5**attempts)
+            attempts += 1
+            await asyncio.sleep(interval + random.uniform(0, 0.5))
+
+    async def _wait_for_reply_event(
+        self,
+        events: SlackEventListener,
+        channel: str,
+        thread_ts: str,
+        timeout_seconds: float,
+    ) -> Message | None:
+        """Wait for a reply delivered by the Socket Mode listener.
 
-        return None
+        A slow poll runs alongside the event stream. Its first check catches
+        a reply posted before we subscribed, and later checks find replies
+        whose events were missed, e.g. during a reconnect or when the app
+        isn't subscribed to message events.
+        """
+        queue = events.subscribe(channel, thread_ts)
+        poll_max_sec = self.config.poll_max_sec
+
+        async def _backup_poll() -> Message:
+            # Best-effort: a failing poll must not end a wait the event
+            # stream can still satisfy, so errors just delay the next poll
+            while True:
+                try:
+                    return await self._poll_until_reply(channel, thread_ts, poll_max_sec)
+                except Exception:
+                    await asyncio.sleep(poll_max_sec)
+
+        async def _first_reply() -> Message:
+            waiters = [
+                asyncio.ensure_future(queue.get()),
+                asyncio.ensure_future(_backup_poll()),
+            ]
+            try:
+                done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                return done.pop().result()
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
 
-    def get_channel_id(self, channel_name: str) -> str | None:
+        try:
+            return await asyncio.wait_for(_first_reply(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            events.unsubscribe(channel, thread_ts)
+
+    async def get_channel_id(self, channel_name: str) -> str | None:
         """Get channel ID from channel name.
 
         Args:
@@ -211,34 +776,68 @@ class SlackClient:
         Returns:
             Channel ID or None if not found.
         """
+        from slack_sdk.errors import SlackApiError
+
         name = channel_name.lstrip("#")
 
+        if not self._channel_ids:
+            # File I/O runs in a thread to keep the event loop responsive
+            self._channel_ids.update(await asyncio.to_thread(self._load_channel_cache))
+        if name in self._channel_ids:
+            return self._channel_ids[name]
+
+        # Record every channel seen so one scan serves later lookups too
         try:
-            # Try public channels first
-            result = self.client.conversations_list(types="public_channel,private_channel")
-            for channel in result.get("channels", []):
-                if channel["name"] == name:
-                    return channel["id"]
-
-            # Paginate if needed
-            while result.get("response_metadata", {}).get("next_cursor"):
-                result = self.client.conversations_list(
+            cursor = None
+            while True:
+                result = await self._call(
+                    "conversations_list",
                     types="public_channel,private_channel",
-                    cursor=result["response_metadata"]["next_cursor"],
+                    limit=1000,
+                    cursor=cursor,
                 )
                 for channel in result.get("channels", []):
-                    if channel["name"] == name:
-                        return channel["id"]
+                    self._channel_ids[channel["name"]] = channel["id"]
+
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
 
         except SlackApiError:
             pass
+        else:
+            await asyncio.to_thread(self._save_channel_cache, dict(self._channel_ids))
 
-        return None
+        return self._channel_ids.get(name)
+
+    def _load_channel_cache(self) -> dict[str, str]:
+        """Load channel IDs saved by a previous run, if still fresh."""
+        try:
+            data = json.loads(self._channel_cache_path.read_text())
+            if time.time() - data["saved_at"] < _CHANNEL_CACHE_TTL:
+                return dict(data["channels"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _save_channel_cache(self, channel_ids: dict[str, str]) -> None:
+        """Persist channel IDs for later runs."""
+        path = self._channel_cache_path
+        data = {"saved_at": time.time(), "channels": channel_ids}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(path)
+        except OSError:
+            pass
 
-    def get_bot_user_id(self) -> str | None:
+    async def get_bot_user_id(self) -> str | None:
         """Get the bot's own user ID."""
+        from slack_sdk.errors import SlackApiError
+
         try:
-            result = self.client.auth_test()
+            result = await self._call("auth_test")
             return result.get("user_id")
         except SlackApiError:
             return None
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Literal
 
 from ..slack_client import SlackClient, SlackConfig
 
+_ASK_TEMPLATE_CTX = (
+    ":question: *Claude Code needs your input*\n\n"
+    "*Context:* {context}\n\n"
+    "*Question:* {question}\n\n"
+    "_Reply in this thread within {mins} minutes._"
+)
+_ASK_TEMPLATE = (
+    ":question: *Claude Code needs your input*\n\n"
+    "{question}\n\n"
+    "_Reply in this thread within {mins} minutes._"
+)
 
+
+def _format_question(question: str, context: str | None, timeout_minutes: int) -> str:
+    """Format an ask_user question for Slack."""
+    template = _ASK_TEMPLATE_CTX if context else _ASK_TEMPLATE
+    return template.format(question=question, context=context, mins=timeout_minutes)
+
+
+@functools.lru_cache(maxsize=1)
 def _get_client() -> SlackClient:
-    """Get or create a Slack client."""
+    """Get the shared Slack client, creating it on first use."""
     config = SlackConfig.from_env()
     return SlackClient(config)
 
 
-def ask_user(
+async def ask_user(
     question: str,
     channel: str | None = None,
     context: str | None = None,
@@ -40,22 +60,10 @@ def ask_user(
     timeout_seconds = timeout_minutes * 60
 
     # Format the question message
-    if context:
-        formatted_message = (
-            f":question: *Claude Code needs your input*\n\n"
-            f"*Context:* {context}\n\n"
-            f"*Question:* {question}\n\n"
-            f"_Reply in this thread within {timeout_minutes} minutes._"
-        )
-    else:
-        formatted_message = (
-            f":question: *Claude Code needs your input*\n\n"
-            f"{question}\n\n"
-            f"_Reply in this thread within {timeout_minutes} minutes._"
-        )
+    formatted_message = _format_question(question, context, timeout_minutes)
 
     # Send the question
-    send_result = client.send_message(text=formatted_message, channel=channel)
+    send_result = await client.send_message(text=formatted_message, channel=channel)
 
     if not send_result.ok:
         return {
@@ -66,25 +74,27 @@ def ask_user(
         }
 
     # Wait for reply
-    reply = client.wait_for_reply(
+    reply = await client.wait_for_reply(
         channel=send_result.channel,
         thread_ts=send_result.ts,
         timeout_seconds=timeout_seconds,
     )
 
     if reply:
-        # Send acknowledgment
-        client.send_message(
-            text=":white_check_mark: Got it, thanks!",
-            channel=send_result.channel,
-            thread_ts=send_result.ts,
-        )
+        # Acknowledge with a reaction; fall back to a reply if the app
+        # lacks the reactions:write scope
+        if not await client.react(send_result.channel, reply.ts, "white_check_mark"):
+            await client.send_message(
+                text=":white_check_mark: Got it, thanks!",
+                channel=send_result.channel,
+                thread_ts=send_result.ts,
+            )
 
         return {
             "success": True,
             "message": "Received user reply",
             "reply": reply.text,
-            "replied_by": reply.user_name or reply.user,
+            "replied_by": await client.resolve_user_name(reply) or reply.user,
             "user_id": reply.user,
             "ts": reply.ts,
             "channel": send_result.channel,
@@ -92,7 +102,7 @@ def ask_user(
         }
     else:
         # Send timeout message
-        client.send_message(
+        await client.send_message(
             text=f":hourglass: No reply received after {timeout_minutes} minutes. Continuing without input.",
             channel=send_result.channel,
             thread_ts=send_result.ts,
@@ -107,7 +117,7 @@ def ask_user(
         }
 
 
-def send(
+async def send(
     message: str,
     channel: str | None = None,
     thread_ts: str | None = None,
@@ -143,7 +153,7 @@ def send(
     else:
         formatted_message = f"{mention_prefix}{message}"
 
-    result = client.send_message(text=formatted_message, channel=channel, thread_ts=thread_ts)
+    result = await client.send_message(text=formatted_message, channel=channel, thread_ts=thread_ts)
 
     if result.ok:
         return {
@@ -160,7 +170,7 @@ def send(
         }
 
 
-def get_thread_replies(
+async def get_thread_replies(
     channel: str,
     thread_ts: str,
     since_ts: str | None = None,
@@ -180,7 +190,8 @@ def get_thread_replies(
     client = _get_client()
 
     try:
-        replies = client.get_thread_replies(channel, thread_ts, since_ts)
+        replies = await client.get_thread_replies(channel, thread_ts, since_ts)
+        names = await client.resolve_user_names(r.user for r in replies)
 
         return {
             "success": True,
@@ -188,7 +199,7 @@ def get_thread_replies(
             "replies": [
                 {
                     "text": r.text,
-                    "user": r.user_name or r.user,
+                    "user": names.get(r.user) or r.user,
                     "user_id": r.user,
                     "ts": r.ts,
                 }